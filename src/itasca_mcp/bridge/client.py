@@ -101,6 +101,10 @@ class ItascaBridgeClient:
                         # are keepalives; blank lines separate events.
                         if not line.startswith("data:"):
                             continue
+                        # Doorbells only matter to registered waiters; with
+                        # none pending, skip the JSON parse entirely.
+                        if not self._task_events:
+                            continue
                         raw = line[5:].strip()
                         if not raw:
                             continue
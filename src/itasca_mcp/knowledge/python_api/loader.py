@@ -11,6 +11,7 @@ Responsibilities:
 """
 
 import json
+import os
 from collections import defaultdict
 from copy import deepcopy
 from functools import lru_cache
@@ -107,11 +108,7 @@ class DocumentationLoader:
         all_keywords: defaultdict[str, list[str]] = defaultdict(list)
 
         # Load itasca top-level keywords
-        itasca_keywords_path = python_keywords_path(software)
-        if itasca_keywords_path.exists():
-            with open(itasca_keywords_path, encoding="utf-8") as f:
-                data = json.load(f)
-                DocumentationLoader._merge_keywords(all_keywords, data.get("keywords", {}))
+        DocumentationLoader._merge_keywords_file(python_keywords_path(software), all_keywords)
 
         # Load keywords from all sub-modules (recursive)
         modules_dir = python_docs_root(software) / "modules"
@@ -457,6 +454,24 @@ class DocumentationLoader:
             # Deduplicate while preserving order
             target[keyword] = list(dict.fromkeys(target[keyword]))
 
+    @staticmethod
+    def _merge_keywords_file(keywords_file: Path, all_keywords: defaultdict[str, list[str]]) -> None:
+        """Merge a keywords.json file into all_keywords, skipping it if absent.
+
+        Opens the file directly and treats FileNotFoundError as "no keywords"
+        instead of stat-ing it first with exists().
+
+        Args:
+            keywords_file: Path to a keywords.json file
+            all_keywords: Target defaultdict to accumulate keywords
+        """
+        try:
+            with open(keywords_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        DocumentationLoader._merge_keywords(all_keywords, data.get("keywords", {}))
+
     @staticmethod
     def _load_keywords_recursive(directory: Path, all_keywords: defaultdict[str, list[str]]) -> None:
         """Recursively load keywords from a directory tree.
@@ -468,17 +483,17 @@ class DocumentationLoader:
             directory: Directory to scan
             all_keywords: Target defaultdict to accumulate keywords
         """
-        for item in directory.iterdir():
-            if item.is_dir():
-                # Load keywords.json in this directory if it exists
-                keywords_file = item / "keywords.json"
-                if keywords_file.exists():
-                    with open(keywords_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                        DocumentationLoader._merge_keywords(all_keywords, data.get("keywords", {}))
-
-                # Recursively process subdirectories
-                DocumentationLoader._load_keywords_recursive(item, all_keywords)
+        # os.scandir exposes the entry type from the directory listing itself,
+        # so is_dir() needs no extra stat per entry (unlike Path.iterdir()).
+        with os.scandir(directory) as entries:
+            subdirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+        for item in subdirs:
+            # Load keywords.json in this directory if it exists
+            DocumentationLoader._merge_keywords_file(item / "keywords.json", all_keywords)
+
+            # Recursively process subdirectories
+            DocumentationLoader._load_keywords_recursive(item, all_keywords)
 
     @staticmethod
     def load_module(module_key: str, *, software: str) -> dict[str, Any] | None: